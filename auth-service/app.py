@@ -5,17 +5,78 @@ This is the entry point for the Auth Service microservice.
 It provides endpoints for user registration, login, and token validation.
 """
 
-from flask import Flask, request, jsonify
+from flask import Flask, Response, current_app, request, jsonify
+from flask.json.provider import DefaultJSONProvider, JSONProvider
 from flask_cors import CORS
-from models import db, User
+from sqlalchemy import select, insert
+from sqlalchemy.exc import IntegrityError
+from models import db, User, user_to_dict, hash_password, check_password_hash
 from config import config
 import jwt
-from datetime import datetime, timedelta
+import orjson
+import base64
+import hashlib
+import hmac
+import re
+import threading
+import time
+from cachetools import TLRUCache, TTLCache
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from functools import wraps
 
+class OrjsonProvider(JSONProvider):
+    """
+    JSON provider backed by orjson
+    
+    Flask uses the standard library json module by default. orjson is a
+    much faster C implementation, and every endpoint here is small JSON in,
+    small JSON out, so this speeds up both request.get_json() and jsonify().
+    orjson handles datetime, dataclass and UUID values natively.
+    
+    orjson has no equivalent of json's keyword arguments (indent, sort_keys,
+    default, ...), so calls that pass any are handed to Flask's default
+    provider instead of silently ignoring them.
+    """
+    
+    def __init__(self, app):
+        super().__init__(app)
+        self._fallback = DefaultJSONProvider(app)
+    
+    def dumps(self, obj, **kwargs):
+        if kwargs:
+            return self._fallback.dumps(obj, **kwargs)
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+    
+    def loads(self, s, **kwargs):
+        if kwargs:
+            return self._fallback.loads(s, **kwargs)
+        # orjson accepts str and bytes directly (no intermediate decode)
+        return orjson.loads(s)
+    
+    def response(self, *args, **kwargs):
+        # Same argument rules as jsonify(): one positional value, several
+        # positional values (a list) or keyword arguments (a dict)
+        if args and kwargs:
+            raise TypeError('jsonify() behavior undefined when passed both args and kwargs')
+        if not args:
+            obj = kwargs or None
+        elif len(args) == 1:
+            obj = args[0]
+        else:
+            obj = list(args)
+        
+        # Skip the bytes -> str -> bytes round trip that dumps() would cause
+        body = orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+        return current_app.response_class(body, mimetype='application/json')
+
+
 # Create Flask application
 app = Flask(__name__)
 
+# Use orjson for all JSON parsing and serialization
+app.json = OrjsonProvider(app)
+
 # Load configuration from config.py
 app.config.from_object(config)
 
@@ -43,6 +104,269 @@ def init_database():
         print("✅ Database tables created successfully!")
 
 
+# ============================================================================
+# PASSWORD HASHING
+# ============================================================================
+
+# bcrypt calls run on this pool rather than directly on the request thread.
+# bcrypt releases the GIL, so hashes run truly in parallel - up to
+# PASSWORD_HASH_WORKERS in this process (gunicorn.conf.py sizes it so all
+# workers together use about one thread per core). Extra concurrent requests
+# wait for a free slot instead of all fighting over the same cores.
+_password_pool = ThreadPoolExecutor(
+    max_workers=config.PASSWORD_HASH_WORKERS,
+    thread_name_prefix='bcrypt'
+)
+
+# Separate pool for /register/batch. A batch queues up to
+# REGISTER_BATCH_MAX_USERS hashes at once; on the shared pool every /login
+# would wait behind them. Here batches only ever wait for each other, and
+# the hashes within a batch run in parallel (REGISTER_BATCH_HASH_WORKERS).
+_batch_password_pool = ThreadPoolExecutor(
+    max_workers=config.REGISTER_BATCH_HASH_WORKERS,
+    thread_name_prefix='bcrypt-batch'
+)
+
+
+# ============================================================================
+# JWT SIGNING
+# ============================================================================
+
+def _base64url_encode(data):
+    """Base64url-encode bytes without padding, as JWT requires"""
+    return base64.urlsafe_b64encode(data).rstrip(b'=')
+
+
+def _base64url_decode(data):
+    """Decode unpadded base64url bytes (raises ValueError if malformed)"""
+    return base64.urlsafe_b64decode(data + b'=' * (-len(data) % 4))
+
+
+# Every token uses the same header, so encode it once at startup
+# (this is exactly what PyJWT produces for HS256)
+_JWT_HEADER_B64 = _base64url_encode(b'{"alg":"HS256","typ":"JWT"}')
+
+# Secret key as bytes, ready for HMAC
+_JWT_SECRET_BYTES = config.JWT_SECRET_KEY.encode('utf-8')
+
+# HMAC SHA-256 context with the secret key already absorbed.
+# Setting up HMAC hashes the key padding every time; copying this template
+# skips that. The template itself is never updated, so copies are thread-safe.
+_HMAC_TEMPLATE = hmac.new(_JWT_SECRET_BYTES, digestmod=hashlib.sha256)
+
+
+def _sign(signing_input):
+    """Compute the HS256 signature of "<header>.<payload>" bytes"""
+    mac = _HMAC_TEMPLATE.copy()
+    mac.update(signing_input)
+    return mac.digest()
+
+
+def constant_time_compare(a, b):
+    """
+    Compare two secrets (signatures, tokens, hashes) in constant time
+    
+    Args:
+        a (bytes | str): First value
+        b (bytes | str): Second value (same type as a)
+        
+    Returns:
+        bool: True if equal
+        
+    Security Note:
+        Never use == for these comparisons: it stops at the first differing
+        byte, so response timing reveals how much of a guess was correct.
+        hmac.compare_digest always looks at every byte and runs in C.
+    """
+    return hmac.compare_digest(a, b)
+
+
+def _verify_jwt(token):
+    """
+    Verify an HS256 token and return its payload
+    
+    Args:
+        token (str): JWT token
+        
+    Returns:
+        dict: Decoded payload
+        
+    Raises:
+        jwt.ExpiredSignatureError: Token has expired
+        jwt.InvalidTokenError: Token is malformed, tampered with or not HS256
+        
+    Same checks as jwt.decode(token, key, algorithms=['HS256']) for the tokens
+    we issue, but reuses the precomputed header and HMAC context.
+    """
+    try:
+        signing_input, signature_b64 = token.encode('ascii').rsplit(b'.', 1)
+        header_b64, payload_b64 = signing_input.split(b'.')
+        signature = _base64url_decode(signature_b64)
+    except ValueError:
+        raise jwt.DecodeError('Invalid token format')
+    
+    # Our own tokens always carry the precomputed header; anything else
+    # must at least declare HS256
+    if header_b64 != _JWT_HEADER_B64:
+        try:
+            header = orjson.loads(_base64url_decode(header_b64))
+        except ValueError:
+            raise jwt.DecodeError('Invalid header')
+        if not isinstance(header, dict) or header.get('alg') != 'HS256':
+            raise jwt.InvalidAlgorithmError('The specified alg value is not allowed')
+    
+    if not constant_time_compare(signature, _sign(signing_input)):
+        raise jwt.InvalidSignatureError('Signature verification failed')
+    
+    try:
+        payload = orjson.loads(_base64url_decode(payload_b64))
+    except ValueError:
+        raise jwt.DecodeError('Invalid payload')
+    if not isinstance(payload, dict):
+        raise jwt.DecodeError('Invalid payload')
+    
+    # Every token we issue has an integer expiration time
+    exp = payload.get('exp')
+    if not isinstance(exp, int) or isinstance(exp, bool):
+        raise jwt.MissingRequiredClaimError('exp')
+    if exp <= time.time():
+        raise jwt.ExpiredSignatureError('Signature has expired')
+    
+    return payload
+
+
+# ============================================================================
+# JWT CLAIMS
+# ============================================================================
+
+@dataclass(slots=True, frozen=True)
+class JWTClaims:
+    """
+    The data carried in our JWT tokens
+    
+    A slotted dataclass instead of a dict: much smaller in memory (the token
+    cache can hold thousands of these) and faster attribute access.
+    Frozen because cached instances are shared between requests.
+    orjson (and so jsonify) serializes it like a dict with these fields.
+    """
+    user_id: int
+    username: str
+    email: str
+    exp: int  # Expiration time (seconds since epoch)
+    iat: int  # Issued at time (seconds since epoch)
+    
+    @classmethod
+    def from_payload(cls, payload):
+        """
+        Build claims from a decoded token payload
+        
+        Raises:
+            jwt.MissingRequiredClaimError: If a claim is missing
+        """
+        try:
+            return cls(
+                user_id=payload['user_id'],
+                username=payload['username'],
+                email=payload['email'],
+                exp=payload['exp'],
+                iat=payload['iat']
+            )
+        except KeyError as e:
+            raise jwt.MissingRequiredClaimError(e.args[0])
+
+
+# ============================================================================
+# TOKEN CACHE
+# ============================================================================
+
+# Decoded JWT claims, keyed by a hash of the raw token.
+# Each entry expires after JWT_CACHE_TTL_SECONDS or when the token itself
+# expires, whichever comes first - so an expired token is never served from cache.
+# cachetools caches are not thread-safe, so all access goes through the lock.
+_token_cache = TLRUCache(
+    maxsize=config.JWT_CACHE_MAXSIZE,
+    ttu=lambda key, claims, now: min(now + config.JWT_CACHE_TTL_SECONDS, claims.exp),
+    timer=time.time
+)
+_token_cache_lock = threading.Lock()
+
+# Hashes of tokens that recently FAILED validation.
+# A client (or attacker) replaying the same bad token gets rejected without
+# re-running the signature check. The TTL is very short so nothing about a
+# token's status is remembered for long. Shares _token_cache_lock.
+_invalid_token_cache = TTLCache(
+    maxsize=config.JWT_INVALID_CACHE_MAXSIZE,
+    ttl=config.JWT_INVALID_CACHE_TTL_SECONDS
+)
+
+
+def _token_cache_key(token):
+    """
+    Build the cache key for a token
+    
+    We store a short hash instead of the token itself so raw tokens
+    don't sit around in process memory.
+    """
+    return hashlib.blake2b(token.encode('utf-8'), digest_size=16).digest()
+
+
+# ============================================================================
+# LOGIN CACHE
+# ============================================================================
+
+# Columns returned to clients (see models.user_to_dict)
+_USER_COLUMNS = (User.id, User.username, User.email, User.is_active, User.created_at, User.updated_at)
+
+# Users looked up by /login, keyed by email.
+# We store plain data - (user dict, password hash) - not the ORM object,
+# which belongs to the database session of the request that loaded it.
+_login_cache = TTLCache(
+    maxsize=config.LOGIN_CACHE_MAXSIZE,
+    ttl=config.LOGIN_CACHE_TTL_SECONDS
+)
+_login_cache_lock = threading.Lock()
+
+
+def find_login_user(email):
+    """
+    Look up the data /login needs for a user, using the login cache
+    
+    Args:
+        email (str): User's email
+        
+    Returns:
+        tuple: (user dict as returned by User.to_dict(), password hash)
+        None: If no user has this email (not cached)
+    """
+    with _login_cache_lock:
+        entry = _login_cache.get(email)
+    if entry is not None:
+        return entry
+    
+    # Plain column query: returns a lightweight row, no ORM object to build
+    row = db.session.execute(
+        select(*_USER_COLUMNS, User.password_hash).where(User.email == email)
+    ).first()
+    if not row:
+        return None
+    
+    entry = (user_to_dict(row), row.password_hash)
+    with _login_cache_lock:
+        _login_cache[email] = entry
+    return entry
+
+
+def invalidate_login_cache(email):
+    """
+    Drop a cached login entry
+    
+    Call this whenever a user's email, password or active status changes,
+    otherwise /login may use stale data for up to LOGIN_CACHE_TTL_SECONDS.
+    """
+    with _login_cache_lock:
+        _login_cache.pop(email, None)
+
+
 # ============================================================================
 # UTILITY FUNCTIONS
 # ============================================================================
@@ -64,26 +388,27 @@ def generate_jwt_token(user_id, username, email):
         - Payload: User data and expiration
         - Signature: Ensures token hasn't been tampered with
     """
-    # Calculate expiration time
-    expiration = datetime.utcnow() + timedelta(seconds=config.JWT_EXPIRATION_SECONDS)
+    # Current time as integer seconds since the epoch (the format JWT uses)
+    now = int(time.time())
     
     # Create payload (data to encode in token)
-    payload = {
-        'user_id': user_id,
-        'username': username,
-        'email': email,
-        'exp': expiration,  # Expiration time
-        'iat': datetime.utcnow()  # Issued at time
-    }
-    
-    # Encode payload with secret key
-    token = jwt.encode(
-        payload,
-        config.JWT_SECRET_KEY,
-        algorithm='HS256'  # HMAC with SHA-256
+    claims = JWTClaims(
+        user_id=user_id,
+        username=username,
+        email=email,
+        exp=now + config.JWT_EXPIRATION_SECONDS,
+        iat=now
     )
     
-    return token
+    # Build "<header>.<payload>" - the header is precomputed (see JWT SIGNING)
+    payload_b64 = _base64url_encode(orjson.dumps(claims))
+    signing_input = _JWT_HEADER_B64 + b'.' + payload_b64
+    
+    # Sign with HMAC SHA-256 using the secret key
+    signature = _sign(signing_input)
+    
+    token = signing_input + b'.' + _base64url_encode(signature)
+    return token.decode('ascii')
 
 
 def decode_jwt_token(token):
@@ -94,23 +419,158 @@ def decode_jwt_token(token):
         token (str): JWT token to decode
         
     Returns:
-        dict: Decoded payload if valid
+        JWTClaims: Decoded claims if valid
         None: If token is invalid or expired
+        
+    Valid claims are cached (see TOKEN CACHE above), so a token that was
+    already verified skips the signature check. Failures are remembered for
+    a few seconds so replaying a bad token is cheap too.
     """
-    try:
-        # Decode token with secret key
-        payload = jwt.decode(
-            token,
-            config.JWT_SECRET_KEY,
-            algorithms=['HS256']
-        )
-        return payload
-    except jwt.ExpiredSignatureError:
-        # Token has expired
+    if not isinstance(token, str):
         return None
+    
+    key = _token_cache_key(token)
+    
+    with _token_cache_lock:
+        claims = _token_cache.get(key)
+        if claims is None and key in _invalid_token_cache:
+            return None
+    if claims is not None:
+        return claims
+    
+    try:
+        # Verify signature and expiration, then decode payload
+        claims = JWTClaims.from_payload(_verify_jwt(token))
+        with _token_cache_lock:
+            _token_cache[key] = claims
+        return claims
     except jwt.InvalidTokenError:
-        # Token is invalid (tampered with or malformed)
+        # Token is expired, tampered with or malformed
+        with _token_cache_lock:
+            _invalid_token_cache[key] = True
+        return None
+
+
+def get_json_body():
+    """
+    Parse the request body as a JSON object
+    
+    Returns:
+        dict: Parsed body
+        None: If the body is missing, not JSON, malformed or not an object
+        
+    A leaner request.get_json() for our small fixed-shape bodies: parses the
+    raw bytes with orjson directly, doesn't keep a cached copy of the body,
+    and returns None instead of raising - so endpoints always answer bad
+    input with their own JSON 400 error.
+    """
+    if not request.is_json:
+        return None
+    
+    try:
+        data = orjson.loads(request.get_data(cache=False))
+    except orjson.JSONDecodeError:
         return None
+    
+    return data if isinstance(data, dict) else None
+
+
+def duplicate_user_field(error):
+    """
+    Work out which unique field caused an IntegrityError on the users table
+    
+    Args:
+        error (IntegrityError): Error raised when inserting a user
+        
+    Returns:
+        str: 'username' or 'email'
+        
+    We only look at the first line of the driver message, which names the
+    constraint or column but not the conflicting value:
+        - SQLite:     UNIQUE constraint failed: users.username
+        - PostgreSQL: duplicate key value violates unique constraint "ix_users_username"
+    """
+    message = str(error.orig).splitlines()[0]
+    return 'username' if 'username' in message else 'email'
+
+
+def duplicate_user_message(error):
+    """Error message for a duplicate-user IntegrityError (see duplicate_user_field)"""
+    if duplicate_user_field(error) == 'username':
+        return 'Username already exists'
+    else:
+        return 'Email already exists'
+
+
+def validate_registration(username, email, password):
+    """
+    Check the fields of a registration request
+    
+    Args:
+        username (str): Requested username
+        email (str): Requested email
+        password (str): Plain text password
+        
+    Returns:
+        str: Error message if a field is missing or invalid
+        None: If everything is valid
+    """
+    # Check all fields are present
+    if not all([username, email, password]):
+        return 'Missing required fields: username, email, password'
+    
+    # Check all fields are strings (JSON could send numbers, lists, ...)
+    if not all(isinstance(field, str) for field in (username, email, password)):
+        return 'Fields username, email, password must be strings'
+    
+    # Validate username length
+    if len(username) < 3:
+        return 'Username must be at least 3 characters'
+    
+    # Validate password length
+    if len(password) < 6:
+        return 'Password must be at least 6 characters'
+    
+    return None
+
+
+def insert_user(username, email, password_hash):
+    """
+    Insert a new user and commit
+    
+    Args:
+        username (str): Username
+        email (str): Email
+        password_hash (str): bcrypt hash (see models.hash_password)
+        
+    Returns:
+        dict: The new user (see models.user_to_dict)
+        
+    Raises:
+        IntegrityError: If the username or email already exists.
+            The caller must roll back the session.
+            
+    There is no separate "does this user exist?" SELECT: the unique
+    indexes on username and email reject duplicates in the INSERT itself,
+    which saves a database round trip and can't race with another request.
+    """
+    # Plain INSERT ... RETURNING instead of building a User object -
+    # one statement, and no reload of the row after commit
+    new_user = db.session.execute(
+        insert(User)
+        .values(username=username, email=email, password_hash=password_hash)
+        .returning(*_USER_COLUMNS)
+    ).one()
+    db.session.commit()
+    
+    # Make sure /login sees the new account straight away
+    invalidate_login_cache(email)
+    
+    return user_to_dict(new_user)
+
+
+# "Bearer <token>" with exactly one space and no whitespace in the token
+_BEARER_HEADER = re.compile(r'Bearer (\S+)')
 
 
 def token_required(f):
@@ -121,31 +581,45 @@ def token_required(f):
         @app.route('/protected')
         @token_required
         def protected_route(current_user):
-            return jsonify({'message': f'Hello {current_user["username"]}'})
+            return jsonify({'message': f'Hello {current_user.username}'})
+    
+    current_user is the decoded token (JWTClaims: user_id, username, email,
+    exp, iat). Protected endpoints should answer from these claims and not
+    query the database on every request. If a route ever needs other user
+    fields (e.g. is_active), cache them by user_id (like the login cache)
+    rather than querying per request.
     """
+    # @wraps keeps the route function's name, which Flask uses as the endpoint name
     @wraps(f)
-    def decorated(*args, **kwargs):
+    def decorated(**kwargs):
         # Get token from Authorization header
         # Expected format: "Bearer <token>"
+        # (Flask passes URL parameters as keyword arguments only)
         auth_header = request.headers.get('Authorization')
         
         if not auth_header:
             return jsonify({'error': 'Authorization header is missing'}), 401
         
         # Extract token from "Bearer <token>"
-        parts = auth_header.split()
-        if len(parts) != 2 or parts[0].lower() != 'bearer':
-            return jsonify({'error': 'Invalid authorization header format. Use: Bearer <token>'}), 401
-        
-        token = parts[1]
+        # Fast path: the exact form every client sends - one C-level match,
+        # no split()/lower(). \S+ treats whitespace exactly like str.split().
+        match = _BEARER_HEADER.fullmatch(auth_header)
+        if match:
+            token = match.group(1)
+        else:
+            # Slow path: other casing ("bearer") or extra whitespace
+            parts = auth_header.split()
+            if len(parts) != 2 or parts[0].lower() != 'bearer':
+                return jsonify({'error': 'Invalid authorization header format. Use: Bearer <token>'}), 401
+            token = parts[1]
         
         # Decode and validate token
-        payload = decode_jwt_token(token)
-        if not payload:
+        claims = decode_jwt_token(token)
+        if not claims:
             return jsonify({'error': 'Invalid or expired token'}), 401
         
         # Pass user info to the route function
-        return f(current_user=payload, *args, **kwargs)
+        return f(current_user=claims, **kwargs)
     
     return decorated
 
@@ -154,6 +628,10 @@ def token_required(f):
 # API ENDPOINTS
 # ============================================================================
 
+# Response body for /health, built once at startup
+_HEALTH_BODY = orjson.dumps({'status': 'healthy', 'service': 'auth-service'})
+
+
 @app.route('/health', methods=['GET'])
 def health_check():
     """
@@ -161,12 +639,10 @@ def health_check():
     
     Used by AWS load balancers to check if service is running.
     Returns 200 if service is healthy.
+    
+    Polled every few seconds, so the body is a precomputed constant.
     """
-    return jsonify({
-        'status': 'healthy',
-        'service': 'auth-service',
-        'timestamp': datetime.utcnow().isoformat()
-    }), 200
+    return Response(_HEALTH_BODY, status=200, mimetype='application/json')
 
 
 @app.route('/register', methods=['POST'])
@@ -197,7 +673,7 @@ def register():
         }
     """
     # Get JSON data from request
-    data = request.get_json()
+    data = get_json_body()
     
     # Validate required fields
     if not data:
@@ -207,51 +683,121 @@ def register():
     email = data.get('email')
     password = data.get('password')
     
-    # Check all fields are present
-    if not all([username, email, password]):
-        return jsonify({'error': 'Missing required fields: username, email, password'}), 400
-    
-    # Validate username length
-    if len(username) < 3:
-        return jsonify({'error': 'Username must be at least 3 characters'}), 400
-    
-    # Validate password length
-    if len(password) < 6:
-        return jsonify({'error': 'Password must be at least 6 characters'}), 400
-    
-    # Check if user already exists
-    existing_user = User.query.filter(
-        (User.username == username) | (User.email == email)
-    ).first()
-    
-    if existing_user:
-        if existing_user.username == username:
-            return jsonify({'error': 'Username already exists'}), 400
-        else:
-            return jsonify({'error': 'Email already exists'}), 400
+    # Validate fields
+    error = validate_registration(username, email, password)
+    if error:
+        return jsonify({'error': error}), 400
     
     # Create new user
     try:
-        new_user = User(
-            username=username,
-            email=email
-        )
-        new_user.set_password(password)  # Hash the password
+        # Hash the password on the bcrypt pool
+        password_hash = _password_pool.submit(hash_password, password).result()
         
-        # Add to database
-        db.session.add(new_user)
-        db.session.commit()
+        new_user = insert_user(username, email, password_hash)
         
         return jsonify({
             'message': 'User registered successfully',
-            'user': new_user.to_dict()
+            'user': new_user
         }), 201
         
+    except IntegrityError as e:
+        db.session.rollback()
+        return jsonify({'error': duplicate_user_message(e)}), 400
+        
     except Exception as e:
         db.session.rollback()
         return jsonify({'error': f'Registration failed: {str(e)}'}), 500
 
 
+@app.route('/register/batch', methods=['POST'])
+def register_batch():
+    """
+    Batch user registration endpoint
+    
+    Registers many users in one request. Passwords are hashed in parallel on
+    a dedicated bcrypt pool (REGISTER_BATCH_HASH_WORKERS threads), separate
+    from the one /login uses, instead of one after another.
+    
+    Request Body (JSON):
+        {
+            "users": [
+                {"username": "john_doe", "email": "john@example.com", "password": "SecurePassword123"},
+                {"username": "jane_doe", "email": "jane@example.com", "password": "AnotherPassword456"}
+            ]
+        }
+        
+    Response (Success - 200):
+        One result per user, in the same order. Each user succeeds or
+        fails on its own:
+        {
+            "results": [
+                {
+                    "created": true,
+                    "user": {
+                        "id": 1,
+                        "username": "john_doe",
+                        "email": "john@example.com"
+                    }
+                },
+                {
+                    "created": false,
+                    "error": "Email already exists"
+                }
+            ]
+        }
+        
+    Response (Error - 400):
+        {
+            "error": "Error message"
+        }
+    """
+    data = get_json_body()
+    
+    if not data or not isinstance(data.get('users'), list):
+        return jsonify({'error': 'No users provided. Send a list: {"users": [...]}'}), 400
+    
+    users = data['users']
+    
+    if len(users) > config.REGISTER_BATCH_MAX_USERS:
+        return jsonify({'error': f'Too many users (max {config.REGISTER_BATCH_MAX_USERS})'}), 400
+    
+    results = [None] * len(users)
+    
+    # Validate every entry first, so we only hash passwords we will use
+    valid = []
+    for i, entry in enumerate(users):
+        if not isinstance(entry, dict):
+            results[i] = {'created': False, 'error': 'Each user must be an object'}
+            continue
+        
+        username = entry.get('username')
+        email = entry.get('email')
+        password = entry.get('password')
+        
+        error = validate_registration(username, email, password)
+        if error:
+            results[i] = {'created': False, 'error': error}
+        else:
+            valid.append((i, username, email, password))
+    
+    # Hash all passwords in parallel on the batch bcrypt pool
+    password_hashes = [_batch_password_pool.submit(hash_password, password) for _, _, _, password in valid]
+    
+    # Insert one by one, so any failure only affects its own entry and the
+    # response always reports every user that was committed
+    for (i, username, email, _), password_hash in zip(valid, password_hashes):
+        try:
+            results[i] = {'created': True, 'user': insert_user(username, email, password_hash.result())}
+        except IntegrityError as e:
+            db.session.rollback()
+            results[i] = {'created': False, 'error': duplicate_user_message(e)}
+        except Exception as e:
+            db.session.rollback()
+            results[i] = {'created': False, 'error': f'Registration failed: {str(e)}'}
+    
+    return jsonify({'results': results}), 200
+
+
 @app.route('/login', methods=['POST'])
 def login():
     """
@@ -280,7 +826,7 @@ def login():
         }
     """
     # Get JSON data from request
-    data = request.get_json()
+    data = get_json_body()
     
     # Validate required fields
     if not data:
@@ -292,27 +838,33 @@ def login():
     if not all([email, password]):
         return jsonify({'error': 'Missing required fields: email, password'}), 400
     
-    # Find user by email
-    user = User.query.filter_by(email=email).first()
+    # Check both fields are strings (JSON could send numbers, lists, ...)
+    if not isinstance(email, str) or not isinstance(password, str):
+        return jsonify({'error': 'Fields email, password must be strings'}), 400
     
-    if not user:
+    # Find user by email (served from the login cache when possible)
+    found = find_login_user(email)
+    
+    if not found:
         return jsonify({'error': 'Invalid credentials'}), 401
     
+    user, password_hash = found
+    
     # Check if account is active
-    if not user.is_active:
+    if not user['is_active']:
         return jsonify({'error': 'Account is deactivated'}), 401
     
-    # Verify password
-    if not user.check_password(password):
+    # Verify password (on the bcrypt pool)
+    if not _password_pool.submit(check_password_hash, password, password_hash).result():
         return jsonify({'error': 'Invalid credentials'}), 401
     
     # Generate JWT token
-    token = generate_jwt_token(user.id, user.username, user.email)
+    token = generate_jwt_token(user['id'], user['username'], user['email'])
     
     return jsonify({
         'message': 'Login successful',
         'token': token,
-        'user': user.to_dict()
+        'user': user
     }), 200
 
 
@@ -344,7 +896,7 @@ def validate_token():
             "error": "Invalid or expired token"
         }
     """
-    data = request.get_json()
+    data = get_json_body()
     
     if not data or 'token' not in data:
         return jsonify({'valid': False, 'error': 'No token provided'}), 400
@@ -352,21 +904,88 @@ def validate_token():
     token = data['token']
     
     # Decode and validate token
-    payload = decode_jwt_token(token)
+    claims = decode_jwt_token(token)
     
-    if not payload:
+    if not claims:
         return jsonify({'valid': False, 'error': 'Invalid or expired token'}), 401
     
     return jsonify({
         'valid': True,
         'user': {
-            'user_id': payload['user_id'],
-            'username': payload['username'],
-            'email': payload['email']
+            'user_id': claims.user_id,
+            'username': claims.username,
+            'email': claims.email
         }
     }), 200
 
 
+@app.route('/validate/batch', methods=['POST'])
+def validate_tokens_batch():
+    """
+    Batch token validation endpoint
+    
+    Validates many tokens in one request, so services checking lots of
+    tokens don't pay a full HTTP round trip per token.
+    
+    Request Body (JSON):
+        {
+            "tokens": ["eyJhbGciOi...", "eyJhbGciOi..."]
+        }
+        
+    Response (Success - 200):
+        One result per token, in the same order:
+        {
+            "results": [
+                {
+                    "valid": true,
+                    "user": {
+                        "user_id": 1,
+                        "username": "john_doe",
+                        "email": "john@example.com"
+                    }
+                },
+                {
+                    "valid": false,
+                    "error": "Invalid or expired token"
+                }
+            ]
+        }
+        
+    Response (Error - 400):
+        {
+            "error": "Error message"
+        }
+    """
+    data = get_json_body()
+    
+    if not data or not isinstance(data.get('tokens'), list):
+        return jsonify({'error': 'No tokens provided. Send a list: {"tokens": [...]}'}), 400
+    
+    tokens = data['tokens']
+    
+    if len(tokens) > config.VALIDATE_BATCH_MAX_TOKENS:
+        return jsonify({'error': f'Too many tokens (max {config.VALIDATE_BATCH_MAX_TOKENS})'}), 400
+    
+    results = []
+    for token in tokens:
+        # Decode and validate token (uses the token cache)
+        claims = decode_jwt_token(token)
+        
+        if not claims:
+            results.append({'valid': False, 'error': 'Invalid or expired token'})
+        else:
+            results.append({
+                'valid': True,
+                'user': {
+                    'user_id': claims.user_id,
+                    'username': claims.username,
+                    'email': claims.email
+                }
+            })
+    
+    return jsonify({'results': results}), 200
+
+
 @app.route('/me', methods=['GET'])
 @token_required
 def get_current_user(current_user):
@@ -386,6 +1005,8 @@ def get_current_user(current_user):
                 "email": "john@example.com"
             }
         }
+        
+    Answered entirely from the token claims - no database query.
     """
     return jsonify({'user': current_user}), 200
 
@@ -29,6 +29,26 @@ class Config:
     # Disable SQLAlchemy modification tracking (saves memory)
     SQLALCHEMY_TRACK_MODIFICATIONS = False
     
+    # Connection Pool
+    # Keep database connections open and reuse them between requests instead
+    # of reconnecting. pool_pre_ping drops connections the server has closed,
+    # pool_recycle replaces connections before RDS/proxies time them out.
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        'pool_pre_ping': True,
+        'pool_recycle': 1800
+    }
+    
+    # Pool size - PostgreSQL only (SQLite's in-memory pool rejects these)
+    # A request thread holds at most one connection at a time, so each gunicorn
+    # worker needs one connection per thread (GUNICORN_THREADS) and no
+    # overflow. Total connections = workers x threads; keep it under the RDS
+    # max_connections.
+    if SQLALCHEMY_DATABASE_URI.startswith('postgresql'):
+        SQLALCHEMY_ENGINE_OPTIONS.update({
+            'pool_size': int(os.getenv('DB_POOL_SIZE', os.getenv('GUNICORN_THREADS', '8'))),
+            'max_overflow': int(os.getenv('DB_MAX_OVERFLOW', '0'))
+        })
+    
     # JWT Secret Key
     # This is used to sign and verify JWT tokens
     # IMPORTANT: Change this in production to a random, secure string
@@ -41,6 +61,50 @@ class Config:
     # 24 hours = 86400 seconds
     JWT_EXPIRATION_SECONDS = 86400
     
+    # Password Hashing
+    # bcrypt work factor: each +1 doubles the cost of hashing AND of checking
+    # a password on /login (12 is roughly 100ms of CPU, 10 roughly 25ms).
+    # Only lower this after reviewing your threat model.
+    BCRYPT_ROUNDS = int(os.getenv('BCRYPT_ROUNDS', '12'))
+    
+    # Number of threads that run bcrypt (hash on /register, check on /login)
+    # This is PER PROCESS. bcrypt is pure CPU work, so across all processes
+    # more threads than CPU cores doesn't help. The default suits a single
+    # process (python app.py); gunicorn.conf.py divides it between workers.
+    PASSWORD_HASH_WORKERS = int(os.getenv('PASSWORD_HASH_WORKERS', str(os.cpu_count() or 1)))
+    
+    # Maximum number of users accepted by POST /register/batch
+    REGISTER_BATCH_MAX_USERS = int(os.getenv('REGISTER_BATCH_MAX_USERS', '50'))
+    
+    # Threads that hash passwords for /register/batch (per process)
+    # Batches get their own pool so a big batch can't make /login and
+    # /register queue behind it. Defaults to PASSWORD_HASH_WORKERS (at least 2)
+    # so a batch really is hashed in parallel under the default gunicorn setup.
+    REGISTER_BATCH_HASH_WORKERS = int(os.getenv(
+        'REGISTER_BATCH_HASH_WORKERS',
+        str(max(2, PASSWORD_HASH_WORKERS))
+    ))
+    
+    # JWT Validation Cache
+    # Decoded token payloads are cached so repeated requests with the same
+    # token skip signature verification. Entries never outlive the token itself.
+    JWT_CACHE_MAXSIZE = int(os.getenv('JWT_CACHE_MAXSIZE', '10000'))
+    JWT_CACHE_TTL_SECONDS = int(os.getenv('JWT_CACHE_TTL_SECONDS', '300'))
+    
+    # Tokens that failed validation are remembered briefly, so replaying the
+    # same bad token doesn't redo the signature check every time
+    JWT_INVALID_CACHE_MAXSIZE = int(os.getenv('JWT_INVALID_CACHE_MAXSIZE', '1024'))
+    JWT_INVALID_CACHE_TTL_SECONDS = int(os.getenv('JWT_INVALID_CACHE_TTL_SECONDS', '5'))
+    
+    # Maximum number of tokens accepted by POST /validate/batch
+    VALIDATE_BATCH_MAX_TOKENS = int(os.getenv('VALIDATE_BATCH_MAX_TOKENS', '100'))
+    
+    # Login Cache
+    # Recently looked-up users are cached by email for a short time so that
+    # repeated /login calls (client retries, app resumes) skip the database.
+    LOGIN_CACHE_MAXSIZE = int(os.getenv('LOGIN_CACHE_MAXSIZE', '4096'))
+    LOGIN_CACHE_TTL_SECONDS = int(os.getenv('LOGIN_CACHE_TTL_SECONDS', '30'))
+    
     # Flask Configuration
     DEBUG = os.getenv('FLASK_DEBUG', 'True') == 'True'
     
@@ -0,0 +1,43 @@
+"""
+Gunicorn configuration for Auth Service
+
+Used by the Docker image to run the app with a production WSGI server
+instead of Flask's development server.
+
+Every setting can be overridden with an environment variable, so the
+container can be tuned per deployment without rebuilding the image.
+
+Database tables are NOT created here: the Docker CMD runs init_database()
+as a separate step before starting gunicorn. Importing the app in the
+gunicorn master would preload it into every worker (so `kill -HUP` reloads
+would never pick up new code, and pools would be created before forking).
+"""
+
+import os
+
+# Listen on all interfaces, same port as the development server
+bind = os.getenv('GUNICORN_BIND', '0.0.0.0:5000')
+
+# Worker processes
+# Each worker is a separate Python process with its own GIL.
+# A common starting point is one or two per CPU core.
+workers = int(os.getenv('GUNICORN_WORKERS', '2'))
+
+# Each worker has its own bcrypt thread pool (see config.PASSWORD_HASH_WORKERS).
+# Split the CPU cores between workers so all pools together run at most
+# one hash per core. An explicit PASSWORD_HASH_WORKERS still wins.
+os.environ.setdefault('PASSWORD_HASH_WORKERS', str(max(1, (os.cpu_count() or 1) // workers)))
+
+# Threaded workers
+# bcrypt releases the GIL while hashing, so with 8 threads per worker
+# several /login and /register requests can hash passwords in parallel
+# instead of queueing behind one another.
+worker_class = os.getenv('GUNICORN_WORKER_CLASS', 'gthread')
+threads = int(os.getenv('GUNICORN_THREADS', '8'))
+
+# Keep client connections open between requests
+# Load balancers reuse connections; re-opening one per request costs a TCP
+# handshake each time. Must be LONGER than the ALB idle timeout (60s):
+# otherwise gunicorn may close a connection the ALB is about to reuse,
+# which shows up as intermittent 502 errors.
+keepalive = int(os.getenv('GUNICORN_KEEPALIVE', '65'))
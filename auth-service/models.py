@@ -7,6 +7,7 @@ ORM = Object-Relational Mapping (we write Python classes, SQLAlchemy creates SQL
 
 from flask_sqlalchemy import SQLAlchemy
 from datetime import datetime
+from config import config
 import bcrypt
 
 # Create SQLAlchemy instance
@@ -30,9 +31,13 @@ class User(db.Model):
     id = db.Column(db.Integer, primary_key=True, autoincrement=True)
     
     # Username: must be unique and cannot be null
+    # unique=True + index=True creates ONE unique index (ix_users_username),
+    # not an index plus a separate unique constraint. It serves lookups and
+    # rejects duplicates on INSERT (see insert_user() in app.py).
     username = db.Column(db.String(80), unique=True, nullable=False, index=True)
     
     # Email: must be unique and cannot be null
+    # Same single unique index (ix_users_email) - used by /login lookups
     email = db.Column(db.String(120), unique=True, nullable=False, index=True)
     
     # Password hash: we NEVER store plain text passwords!
@@ -61,18 +66,9 @@ class User(db.Model):
             - We use bcrypt with salt (automatic in bcrypt)
             - Salt ensures same password creates different hashes
             - This protects against rainbow table attacks
+            - The work factor comes from config.BCRYPT_ROUNDS
         """
-        # Convert password to bytes
-        password_bytes = password.encode('utf-8')
-        
-        # Generate salt and hash password
-        # bcrypt.gensalt() creates a random salt
-        # bcrypt.hashpw() combines password + salt and hashes it
-        salt = bcrypt.gensalt()
-        hashed = bcrypt.hashpw(password_bytes, salt)
-        
-        # Store the hash as a string
-        self.password_hash = hashed.decode('utf-8')
+        self.password_hash = hash_password(password)
     
     def check_password(self, password):
         """
@@ -84,14 +80,7 @@ class User(db.Model):
         Returns:
             bool: True if password matches, False otherwise
         """
-        # Convert inputs to bytes
-        password_bytes = password.encode('utf-8')
-        hash_bytes = self.password_hash.encode('utf-8')
-        
-        # bcrypt.checkpw() compares password with hash
-        # It extracts the salt from the hash and re-hashes the password
-        # Then compares the result with the stored hash
-        return bcrypt.checkpw(password_bytes, hash_bytes)
+        return check_password_hash(password, self.password_hash)
     
     def to_dict(self):
         """
@@ -103,11 +92,77 @@ class User(db.Model):
         Security Note:
             We NEVER include password_hash in API responses!
         """
-        return {
-            'id': self.id,
-            'username': self.username,
-            'email': self.email,
-            'is_active': self.is_active,
-            'created_at': self.created_at.isoformat(),
-            'updated_at': self.updated_at.isoformat()
-        }
+        return user_to_dict(self)
+
+
+def user_to_dict(user):
+    """
+    Convert user data to a dictionary (for JSON responses)
+    
+    Args:
+        user: A User object, or a result row from a column query
+              (id, username, email, is_active, created_at, updated_at)
+              
+    Returns:
+        dict: User data without sensitive information
+        
+    Accepting plain rows lets hot endpoints skip building ORM objects.
+    """
+    return {
+        'id': user.id,
+        'username': user.username,
+        'email': user.email,
+        'is_active': user.is_active,
+        'created_at': user.created_at.isoformat(),
+        'updated_at': user.updated_at.isoformat()
+    }
+
+
+def hash_password(password):
+    """
+    Hash a password with bcrypt
+    
+    Args:
+        password (str): Plain text password
+        
+    Returns:
+        str: bcrypt hash, ready to store in users.password_hash
+        
+    This is what User.set_password uses; it is a plain function so the hash
+    can be computed on a worker thread before the User object exists.
+    """
+    # Convert password to bytes
+    password_bytes = password.encode('utf-8')
+    
+    # Generate salt and hash password
+    # bcrypt.gensalt() creates a random salt (the rounds are stored in it)
+    # bcrypt.hashpw() combines password + salt and hashes it
+    salt = bcrypt.gensalt(rounds=config.BCRYPT_ROUNDS)
+    hashed = bcrypt.hashpw(password_bytes, salt)
+    
+    # Store the hash as a string
+    return hashed.decode('utf-8')
+
+
+def check_password_hash(password, password_hash):
+    """
+    Verify a password against a stored bcrypt hash
+    
+    Args:
+        password (str): Plain text password to check
+        password_hash (str): bcrypt hash as stored in users.password_hash
+        
+    Returns:
+        bool: True if password matches, False otherwise
+        
+    This is what User.check_password uses; it is a plain function so callers
+    that only have the hash (e.g. from a cache) don't need a User object.
+    """
+    # Convert inputs to bytes
+    password_bytes = password.encode('utf-8')
+    hash_bytes = password_hash.encode('utf-8')
+    
+    # bcrypt.checkpw() compares password with hash
+    # It extracts the salt from the hash and re-hashes the password
+    # Then compares the result with the stored hash
+    return bcrypt.checkpw(password_bytes, hash_bytes)
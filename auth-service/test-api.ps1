@@ -127,6 +127,101 @@ try {
     Write-Host ""
 }
 
+# Test 7: Validate Many Tokens
+Write-Host "Test 7: Validate Many Tokens" -ForegroundColor Yellow
+Write-Host "POST $baseUrl/validate/batch" -ForegroundColor Gray
+$batchValidateBody = @{
+    tokens = @($token, "garbage_token_12345", 12345)
+} | ConvertTo-Json
+
+try {
+    $response = Invoke-WebRequest -Uri "$baseUrl/validate/batch" -Method POST -Body $batchValidateBody -ContentType "application/json"
+    $data = $response.Content | ConvertFrom-Json
+    $results = $data.results
+    if ($results.Count -eq 3 -and $results[0].valid -and -not $results[1].valid -and -not $results[2].valid) {
+        Write-Host "✅ Got one result per token, in order" -ForegroundColor Green
+        Write-Host "   Valid token: $($results[0].valid) (user: $($results[0].user.username))" -ForegroundColor Green
+        Write-Host "   Garbage token: $($results[1].valid)" -ForegroundColor Green
+        Write-Host "   Non-string token: $($results[2].valid)" -ForegroundColor Green
+    } else {
+        Write-Host "❌ Unexpected results: $($response.Content)" -ForegroundColor Red
+    }
+    Write-Host ""
+} catch {
+    Write-Host "❌ Batch token validation failed: $_" -ForegroundColor Red
+    Write-Host ""
+}
+
+# Test 8: Too Many Tokens
+# Must match VALIDATE_BATCH_MAX_TOKENS in config.py
+$maxBatchTokens = 100
+Write-Host "Test 8: Validate Too Many Tokens (Should Fail)" -ForegroundColor Yellow
+Write-Host "POST $baseUrl/validate/batch with $($maxBatchTokens + 1) tokens" -ForegroundColor Gray
+$tooManyTokensBody = @{
+    tokens = @(1..($maxBatchTokens + 1) | ForEach-Object { $token })
+} | ConvertTo-Json
+
+try {
+    $response = Invoke-WebRequest -Uri "$baseUrl/validate/batch" -Method POST -Body $tooManyTokensBody -ContentType "application/json"
+    Write-Host "❌ Should have failed but didn't!" -ForegroundColor Red
+    Write-Host ""
+} catch {
+    Write-Host "✅ Correctly rejected oversized batch" -ForegroundColor Green
+    Write-Host "   Error: Too many tokens (max $maxBatchTokens)" -ForegroundColor Green
+    Write-Host ""
+}
+
+# Test 9: Register Many Users
+Write-Host "Test 9: Register Many Users" -ForegroundColor Yellow
+Write-Host "POST $baseUrl/register/batch" -ForegroundColor Gray
+$batchSuffix = Get-Random -Maximum 100000
+$batchRegisterBody = @{
+    users = @(
+        @{ username = "batch_user_$batchSuffix"; email = "batch$batchSuffix@example.com"; password = "TestPassword123" },
+        @{ username = "batch_dup_$batchSuffix"; email = $testEmail; password = "TestPassword123" },
+        @{ username = "batch_bad_$batchSuffix"; email = "bad$batchSuffix@example.com"; password = 1234567 }
+    )
+} | ConvertTo-Json -Depth 5
+
+try {
+    $response = Invoke-WebRequest -Uri "$baseUrl/register/batch" -Method POST -Body $batchRegisterBody -ContentType "application/json"
+    $data = $response.Content | ConvertFrom-Json
+    $results = $data.results
+    if ($results.Count -eq 3 -and $results[0].created -and -not $results[1].created -and -not $results[2].created) {
+        Write-Host "✅ Got one result per user, in order" -ForegroundColor Green
+        Write-Host "   New user: created (ID: $($results[0].user.id))" -ForegroundColor Green
+        Write-Host "   Existing email: $($results[1].error)" -ForegroundColor Green
+        Write-Host "   Non-string password: $($results[2].error)" -ForegroundColor Green
+    } else {
+        Write-Host "❌ Unexpected results: $($response.Content)" -ForegroundColor Red
+    }
+    Write-Host ""
+} catch {
+    Write-Host "❌ Batch registration failed: $_" -ForegroundColor Red
+    Write-Host ""
+}
+
+# Test 10: Too Many Users
+# Must match REGISTER_BATCH_MAX_USERS in config.py
+$maxBatchUsers = 50
+Write-Host "Test 10: Register Too Many Users (Should Fail)" -ForegroundColor Yellow
+Write-Host "POST $baseUrl/register/batch with $($maxBatchUsers + 1) users" -ForegroundColor Gray
+$tooManyUsersBody = @{
+    users = @(1..($maxBatchUsers + 1) | ForEach-Object {
+        @{ username = "too_many_$_"; email = "too_many_$_@example.com"; password = "TestPassword123" }
+    })
+} | ConvertTo-Json -Depth 5
+
+try {
+    $response = Invoke-WebRequest -Uri "$baseUrl/register/batch" -Method POST -Body $tooManyUsersBody -ContentType "application/json"
+    Write-Host "❌ Should have failed but didn't!" -ForegroundColor Red
+    Write-Host ""
+} catch {
+    Write-Host "✅ Correctly rejected oversized batch" -ForegroundColor Green
+    Write-Host "   Error: Too many users (max $maxBatchUsers)" -ForegroundColor Green
+    Write-Host ""
+}
+
 # Summary
 Write-Host "========================================" -ForegroundColor Cyan
 Write-Host "  All Tests Completed!" -ForegroundColor Cyan
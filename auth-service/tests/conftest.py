@@ -0,0 +1,36 @@
+"""
+Shared pytest setup for Auth Service tests
+
+Runs the app against an in-memory SQLite database so tests never touch
+auth.db or a real PostgreSQL instance.
+"""
+
+import os
+import sys
+
+import pytest
+
+# Must be set before config.py is imported (it reads these at import)
+os.environ['DATABASE_URL'] = 'sqlite://'
+# Cheapest bcrypt cost, so tests that register users stay fast
+os.environ['BCRYPT_ROUNDS'] = '4'
+
+# Make app.py, models.py and config.py importable from the tests folder
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture
+def client():
+    """
+    Flask test client with empty tables and empty caches
+    """
+    import app as auth_app
+    
+    with auth_app.app.app_context():
+        auth_app.db.drop_all()
+        auth_app.db.create_all()
+    
+    for cache in (auth_app._token_cache, auth_app._invalid_token_cache, auth_app._login_cache):
+        cache.clear()
+    
+    return auth_app.app.test_client()
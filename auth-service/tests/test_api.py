@@ -0,0 +1,158 @@
+"""
+Tests for the Auth Service HTTP endpoints
+"""
+
+import threading
+
+import pytest
+
+import app as auth_app
+
+
+def register(client, username='john_doe', email='john@example.com', password='SecurePassword123'):
+    return client.post('/register', json={
+        'username': username,
+        'email': email,
+        'password': password
+    })
+
+
+def test_register_batch_hashes_passwords_in_parallel(client, monkeypatch):
+    # Every hash waits until a second one is running at the same time.
+    # If the batch were hashed one password after another, the barrier
+    # would time out and the entries would fail.
+    barrier = threading.Barrier(2, timeout=5)
+    real_hash_password = auth_app.hash_password
+    
+    def hash_password_together(password):
+        barrier.wait()
+        return real_hash_password(password)
+    
+    monkeypatch.setattr(auth_app, 'hash_password', hash_password_together)
+    
+    response = client.post('/register/batch', json={'users': [
+        {'username': 'user_one', 'email': 'one@example.com', 'password': 'SecurePassword123'},
+        {'username': 'user_two', 'email': 'two@example.com', 'password': 'SecurePassword123'}
+    ]})
+    
+    assert response.status_code == 200
+    assert [result['created'] for result in response.get_json()['results']] == [True, True]
+
+
+def test_register_batch_reports_each_entry(client):
+    register(client)
+    
+    response = client.post('/register/batch', json={'users': [
+        {'username': 'jane_doe', 'email': 'jane@example.com', 'password': 'SecurePassword123'},
+        {'username': 'someone', 'email': 'john@example.com', 'password': 'SecurePassword123'},
+        {'username': 'bad_password', 'email': 'bad@example.com', 'password': 1234567},
+        'not-an-object'
+    ]})
+    
+    results = response.get_json()['results']
+    assert response.status_code == 200
+    assert results[0]['created'] and results[0]['user']['username'] == 'jane_doe'
+    assert results[1] == {'created': False, 'error': 'Email already exists'}
+    assert results[2] == {'created': False, 'error': 'Fields username, email, password must be strings'}
+    assert results[3] == {'created': False, 'error': 'Each user must be an object'}
+
+
+def login_token(client):
+    register(client)
+    response = client.post('/login', json={'email': 'john@example.com', 'password': 'SecurePassword123'})
+    return response.get_json()['token']
+
+
+@pytest.mark.parametrize('header, fast_path, status', [
+    ('Bearer {token}', True, 200),
+    ('bearer {token}', False, 200),
+    ('BEARER {token}', False, 200),
+    ('Bearer  {token}', False, 200),
+    ('Bearer \t{token}', False, 200),
+    ('Bearer {token}\t', False, 200),
+    ('  Bearer {token}  ', False, 200),
+    ('Bearer {token} extra', False, 401),
+    ('Bearer {token}\textra', False, 401),
+    ('Token {token}', False, 401),
+    ('Bearer', False, 401),
+    ('Bearer ', False, 401)
+])
+def test_authorization_header_formats(client, header, fast_path, status):
+    # Same accepted formats as str.split(): the fast path only takes the
+    # exact "Bearer <token>" form, everything else goes through split()
+    header = header.format(token=login_token(client))
+    
+    assert bool(auth_app._BEARER_HEADER.fullmatch(header)) == fast_path
+    assert client.get('/me', headers={'Authorization': header}).status_code == status
+
+
+@pytest.mark.parametrize('body', [
+    {'email': ['john@example.com'], 'password': 'SecurePassword123'},
+    {'email': {'address': 'john@example.com'}, 'password': 'SecurePassword123'},
+    {'email': 'john@example.com', 'password': 1234567},
+    {'email': 'john@example.com', 'password': ['SecurePassword123']}
+])
+def test_login_rejects_non_string_fields(client, body):
+    register(client)
+    
+    response = client.post('/login', json=body)
+    
+    assert response.status_code == 400
+    assert response.get_json() == {'error': 'Fields email, password must be strings'}
+
+
+def test_login_uses_cache_on_hit(client):
+    register(client)
+    assert client.post('/login', json={'email': 'john@example.com', 'password': 'SecurePassword123'}).status_code == 200
+    
+    # Remove the row behind the cache's back: a cache hit never asks the database
+    with auth_app.app.app_context():
+        auth_app.db.session.execute(auth_app.User.__table__.delete())
+        auth_app.db.session.commit()
+    
+    response = client.post('/login', json={'email': 'john@example.com', 'password': 'SecurePassword123'})
+    assert response.status_code == 200
+    assert response.get_json()['user']['username'] == 'john_doe'
+    
+    # The cached hash is still checked
+    response = client.post('/login', json={'email': 'john@example.com', 'password': 'WrongPassword'})
+    assert response.status_code == 401
+
+
+def test_insert_user_invalidates_login_cache(client):
+    # A stale entry (e.g. left over from a deleted account) for the same email
+    auth_app._login_cache['john@example.com'] = ({'id': 999}, 'stale-hash')
+    
+    assert register(client).status_code == 201
+    
+    assert 'john@example.com' not in auth_app._login_cache
+    response = client.post('/login', json={'email': 'john@example.com', 'password': 'SecurePassword123'})
+    assert response.status_code == 200
+    assert response.get_json()['user']['username'] == 'john_doe'
+
+
+def test_register_duplicate_username(client):
+    assert register(client).status_code == 201
+    
+    response = register(client, email='other@example.com')
+    
+    assert response.status_code == 400
+    assert response.get_json() == {'error': 'Username already exists'}
+
+
+def test_register_duplicate_email(client):
+    assert register(client).status_code == 201
+    
+    response = register(client, username='someone_else')
+    
+    assert response.status_code == 400
+    assert response.get_json() == {'error': 'Email already exists'}
+
+
+def test_register_duplicate_email_containing_username(client):
+    # The constraint name, not the conflicting value, decides the message
+    assert register(client, username='john_doe', email='username@example.com').status_code == 201
+    
+    response = register(client, username='someone_else', email='username@example.com')
+    
+    assert response.get_json() == {'error': 'Email already exists'}
@@ -0,0 +1,49 @@
+"""
+Tests for the orjson-backed JSON provider
+"""
+
+from datetime import datetime
+
+import pytest
+
+import app as auth_app
+
+
+@pytest.fixture
+def json_provider():
+    with auth_app.app.app_context():
+        yield auth_app.app.json
+
+
+def test_jsonify_single_value(json_provider):
+    response = auth_app.jsonify({'when': datetime(2025, 1, 2, 3, 4, 5)})
+    
+    assert response.mimetype == 'application/json'
+    assert response.get_json() == {'when': '2025-01-02T03:04:05'}
+
+
+def test_jsonify_keyword_arguments(json_provider):
+    assert auth_app.jsonify(valid=True, user=None).get_json() == {'valid': True, 'user': None}
+
+
+def test_jsonify_several_values(json_provider):
+    assert auth_app.jsonify(1, 'two').get_json() == [1, 'two']
+
+
+def test_jsonify_nothing(json_provider):
+    assert auth_app.jsonify().get_json() is None
+
+
+def test_jsonify_rejects_args_and_kwargs(json_provider):
+    with pytest.raises(TypeError):
+        auth_app.jsonify({'a': 1}, b=2)
+
+
+def test_dumps_honours_keyword_arguments(json_provider):
+    assert json_provider.dumps({'b': 1, 'a': 2}) == '{"b":1,"a":2}'
+    assert json_provider.dumps({'b': 1, 'a': 2}, sort_keys=True, indent=2) == '{\n  "a": 2,\n  "b": 1\n}'
+
+
+def test_loads_honours_keyword_arguments(json_provider):
+    assert json_provider.loads(b'{"n": 1.5}') == {'n': 1.5}
+    assert json_provider.loads('{"n": 1.5}', parse_float=str) == {'n': '1.5'}
@@ -0,0 +1,224 @@
+"""
+Tests for JWT signing and verification
+
+app.py signs and verifies HS256 tokens itself instead of calling
+jwt.encode/jwt.decode. These tests check it rejects everything PyJWT would
+reject, and stays compatible with tokens PyJWT issues. They also cover the
+caches in front of it (valid and invalid tokens).
+"""
+
+import base64
+import time
+
+import jwt
+import orjson
+import pytest
+
+import app as auth_app
+from app import JWTClaims, _verify_jwt, decode_jwt_token, generate_jwt_token
+from config import config
+
+
+def make_claims(**overrides):
+    """Claims for a valid token, with optional changes"""
+    now = int(time.time())
+    claims = {
+        'user_id': 1,
+        'username': 'john_doe',
+        'email': 'john@example.com',
+        'exp': now + 3600,
+        'iat': now
+    }
+    claims.update(overrides)
+    return claims
+
+
+def pyjwt_token(claims, key=None, algorithm='HS256'):
+    """Issue a token with PyJWT (the reference implementation)"""
+    return jwt.encode(claims, config.JWT_SECRET_KEY if key is None else key, algorithm=algorithm)
+
+
+def b64url(data):
+    return base64.urlsafe_b64encode(data).rstrip(b'=').decode('ascii')
+
+
+def test_generated_token_verifies():
+    token = generate_jwt_token(1, 'john_doe', 'john@example.com')
+    
+    claims = decode_jwt_token(token)
+    
+    assert claims.user_id == 1
+    assert claims.username == 'john_doe'
+    assert claims.email == 'john@example.com'
+
+
+def test_generated_token_is_accepted_by_pyjwt():
+    token = generate_jwt_token(1, 'john_doe', 'john@example.com')
+    
+    payload = jwt.decode(token, config.JWT_SECRET_KEY, algorithms=['HS256'])
+    
+    assert payload['username'] == 'john_doe'
+
+
+def test_pyjwt_issued_token_verifies():
+    claims = make_claims()
+    
+    assert decode_jwt_token(pyjwt_token(claims)) == JWTClaims(**claims)
+
+
+def test_pyjwt_token_with_extra_header_fields_verifies():
+    claims = make_claims()
+    token = jwt.encode(claims, config.JWT_SECRET_KEY, algorithm='HS256', headers={'kid': 'key-1'})
+    
+    assert decode_jwt_token(token) == JWTClaims(**claims)
+
+
+def test_tampered_payload_is_rejected():
+    header, _, signature = pyjwt_token(make_claims()).split('.')
+    forged_payload = b64url(orjson.dumps(make_claims(user_id=2)))
+    
+    with pytest.raises(jwt.InvalidSignatureError):
+        _verify_jwt(f'{header}.{forged_payload}.{signature}')
+    assert decode_jwt_token(f'{header}.{forged_payload}.{signature}') is None
+
+
+def test_tampered_signature_is_rejected():
+    header, payload, signature = pyjwt_token(make_claims()).split('.')
+    # Change a character in the middle (the last one may only hold padding bits)
+    middle = len(signature) // 2
+    flipped = 'A' if signature[middle] != 'A' else 'B'
+    forged = f'{header}.{payload}.{signature[:middle]}{flipped}{signature[middle + 1:]}'
+    
+    with pytest.raises(jwt.InvalidSignatureError):
+        _verify_jwt(forged)
+    assert decode_jwt_token(forged) is None
+
+
+def test_token_signed_with_another_key_is_rejected():
+    token = pyjwt_token(make_claims(), key='some-other-secret')
+    
+    with pytest.raises(jwt.InvalidSignatureError):
+        _verify_jwt(token)
+
+
+def test_alg_none_is_rejected():
+    token = jwt.encode(make_claims(), None, algorithm='none')
+    
+    with pytest.raises(jwt.InvalidAlgorithmError):
+        _verify_jwt(token)
+    assert decode_jwt_token(token) is None
+
+
+def test_alg_hs512_is_rejected():
+    # Correctly signed with our secret, but not with the algorithm we allow
+    token = pyjwt_token(make_claims(), algorithm='HS512')
+    
+    with pytest.raises(jwt.InvalidAlgorithmError):
+        _verify_jwt(token)
+    assert decode_jwt_token(token) is None
+
+
+def test_expired_token_is_rejected():
+    now = int(time.time())
+    token = pyjwt_token(make_claims(exp=now - 10, iat=now - 100))
+    
+    with pytest.raises(jwt.ExpiredSignatureError):
+        _verify_jwt(token)
+    assert decode_jwt_token(token) is None
+
+
+def test_token_without_exp_is_rejected():
+    claims = make_claims()
+    del claims['exp']
+    token = pyjwt_token(claims)
+    
+    with pytest.raises(jwt.MissingRequiredClaimError):
+        _verify_jwt(token)
+    assert decode_jwt_token(token) is None
+
+
+def test_token_with_non_integer_exp_is_rejected():
+    token = pyjwt_token(make_claims(exp='never'))
+    
+    with pytest.raises(jwt.InvalidTokenError):
+        _verify_jwt(token)
+
+
+def test_token_missing_claim_is_rejected():
+    claims = make_claims()
+    del claims['email']
+    
+    assert decode_jwt_token(pyjwt_token(claims)) is None
+
+
+@pytest.mark.parametrize('token', [
+    'é.a.b',
+    pyjwt_token(make_claims()) + 'é',
+    '‮.‮.‮'
+])
+def test_non_ascii_token_is_rejected(token):
+    with pytest.raises(jwt.DecodeError):
+        _verify_jwt(token)
+    assert decode_jwt_token(token) is None
+
+
+@pytest.mark.parametrize('token', [
+    '',
+    'not-a-token',
+    'a.b',
+    'a.b.c.d',
+    'a.b.!!!'
+])
+def test_malformed_token_is_rejected(token):
+    with pytest.raises(jwt.DecodeError):
+        _verify_jwt(token)
+    assert decode_jwt_token(token) is None
+
+
+def test_non_string_token_is_rejected():
+    assert decode_jwt_token(12345) is None
+    assert decode_jwt_token(None) is None
+
+
+def fail_if_verified(token):
+    raise AssertionError('signature was checked again instead of using the cache')
+
+
+def test_valid_token_is_served_from_cache(monkeypatch):
+    token = pyjwt_token(make_claims())
+    claims = decode_jwt_token(token)
+    
+    monkeypatch.setattr(auth_app, '_verify_jwt', fail_if_verified)
+    
+    assert decode_jwt_token(token) == claims
+
+
+def test_replayed_bad_token_is_served_from_invalid_cache(monkeypatch):
+    token = pyjwt_token(make_claims(), key='some-other-secret')
+    assert decode_jwt_token(token) is None
+    
+    monkeypatch.setattr(auth_app, '_verify_jwt', fail_if_verified)
+    
+    assert decode_jwt_token(token) is None
+
+
+def test_cache_entry_lifetime_is_capped_by_exp():
+    now = time.time()
+    ttl = config.JWT_CACHE_TTL_SECONDS
+    ttu = auth_app._token_cache.ttu
+    
+    # Token outlives the cache TTL: the TTL wins
+    assert ttu(b'key', JWTClaims(**make_claims(exp=int(now) + ttl * 10)), now) == now + ttl
+    # Token expires first: the entry expires with it
+    assert ttu(b'key', JWTClaims(**make_claims(exp=int(now) + 1)), now) == int(now) + 1
+
+
+def test_cached_token_stops_validating_at_exp():
+    exp = int(time.time()) + 1
+    token = pyjwt_token(make_claims(exp=exp))
+    assert decode_jwt_token(token) is not None
+    
+    # Wait until just past exp; a stale cache entry would still return claims
+    time.sleep(max(0, exp - time.time()) + 0.05)
+    
+    assert decode_jwt_token(token) is None